@@ -0,0 +1,142 @@
+# ============================================================
+# calendario_turnos.py
+# ------------------------------------------------------------
+# Avalia o calendário de turnos (turnos.py) sobre a tabela de
+# atividades de uma só vez, de forma vetorizada.
+# O resultado é uma matriz atividade × turno (booleana): incluir
+# novos turnos acrescenta colunas, sem repetir a filtragem linha
+# a linha.
+# ============================================================
+from datetime import datetime, time, timedelta
+import numpy as np
+import pandas as pd
+
+# Status incluídos em todos os turnos do dia, independente do horário
+STATUS_PRIORITARIOS = ("atraso", "em andamento")
+
+DIAS_SEMANA = {"seg": 0, "ter": 1, "qua": 2, "qui": 3, "sex": 4, "sáb": 5, "sab": 5, "dom": 6}
+
+
+# ============================================================
+# Leitura do calendário
+# ============================================================
+
+def _ler_hora(valor, turno: str, campo: str) -> time:
+    try:
+        horas, minutos = map(int, str(valor).split(":"))
+        return time(horas, minutos)
+    except Exception:
+        raise ValueError(f"Turno '{turno}': {campo} inválido ({valor!r}), use HH:MM")
+
+
+def _ler_dias(dias, turno: str):
+    if not dias:
+        return None
+    convertidos = set()
+    for dia in dias:
+        if isinstance(dia, int) and 0 <= dia <= 6:
+            convertidos.add(dia)
+        elif str(dia).strip().lower()[:3] in DIAS_SEMANA:
+            convertidos.add(DIAS_SEMANA[str(dia).strip().lower()[:3]])
+        else:
+            raise ValueError(f"Turno '{turno}': dia da semana inválido ({dia!r})")
+    return frozenset(convertidos)
+
+
+def carregar_calendario(turnos: dict = None) -> dict:
+    """
+    Normaliza o calendário de turnos.
+
+    Parâmetros:
+        turnos (dict, opcional): Dicionário no formato de turnos.TURNOS.
+                                 Se não for informado, usa o arquivo turnos.py.
+
+    Retorna:
+        dict: {NOME_EM_MAIÚSCULAS: {"nome", "inicio", "fim", "virada",
+               "encarregado", "dias"}} na ordem em que foram definidos.
+    """
+    if turnos is None:
+        from turnos import TURNOS
+        turnos = TURNOS
+
+    calendario = {}
+    for nome, definicao in turnos.items():
+        inicio = _ler_hora(definicao["INICIO"], nome, "INICIO")
+        fim = _ler_hora(definicao["FIM"], nome, "FIM")
+        calendario[nome.upper()] = {
+            "nome": nome,
+            "inicio": inicio,
+            "fim": fim,
+            "virada": fim <= inicio,  # termina no dia seguinte
+            "encarregado": definicao["ENCARREGADO"],
+            "dias": _ler_dias(definicao.get("DIAS"), nome),
+        }
+    return calendario
+
+
+def coluna_responsavel(calendario: dict, turno: str) -> str:
+    """Retorna a coluna de Encarregado do turno informado (ignora maiúsculas/minúsculas)."""
+    try:
+        return calendario[turno.upper()]["encarregado"]
+    except KeyError:
+        raise KeyError(f"Turno '{turno}' não definido no calendário de turnos")
+
+
+# ============================================================
+# Avaliação vetorizada
+# ============================================================
+
+def _combinar(datas: pd.Series, horas: pd.Series) -> pd.Series:
+    """Soma data (date) e hora (time/HH:MM) em uma série datetime64 (NaT se faltar algo)."""
+    dias = pd.to_datetime(datas, errors="coerce")
+    deslocamento = pd.to_timedelta(horas.astype(str).str.slice(0, 5) + ":00", errors="coerce")
+    return dias + deslocamento
+
+
+def matriz_turnos(df: pd.DataFrame, data, calendario: dict) -> pd.DataFrame:
+    """
+    Calcula a pertinência de cada atividade a cada turno do dia.
+
+    Uma atividade pertence ao turno se o intervalo (início, fim) dela se
+    sobrepõe à janela do turno, ou se o status for prioritário
+    ('Atraso'/'Em andamento'). Turnos restritos a alguns dias da semana
+    ficam vazios nos demais dias.
+
+    Parâmetros:
+        df (DataFrame): Atividades (colunas "Cronograma - Start/End",
+                        "Hora Início/Fim" e "Status").
+        data (date): Data da Folha-Tarefa.
+        calendario (dict): Resultado de `carregar_calendario`.
+
+    Retorna:
+        DataFrame: Matriz booleana com o índice de `df` e uma coluna por turno.
+    """
+    inicio = _combinar(df["Cronograma - Start"], df["Hora Início"])
+    fim = _combinar(df["Cronograma - End"], df["Hora Fim"])
+
+    # Corrige virada de dia
+    fim = fim.where(fim > inicio, fim + pd.Timedelta(days=1))
+
+    inicio = inicio.to_numpy()
+    fim = fim.to_numpy()
+    valido = ~(np.isnat(inicio) | np.isnat(fim))
+
+    status = df["Status"].fillna("").astype(str).str.strip().str.lower() if "Status" in df else None
+    prioritaria = (
+        status.isin(STATUS_PRIORITARIOS).to_numpy() if status is not None
+        else np.zeros(len(df), dtype=bool)
+    )
+
+    colunas = {}
+    for chave, turno in calendario.items():
+        if turno["dias"] is not None and data.weekday() not in turno["dias"]:
+            colunas[chave] = np.zeros(len(df), dtype=bool)
+            continue
+
+        janela_ini = datetime.combine(data, turno["inicio"])
+        janela_fim = datetime.combine(data + timedelta(days=1) if turno["virada"] else data, turno["fim"])
+
+        sobrepoe = valido & (inicio < np.datetime64(janela_fim)) & (fim > np.datetime64(janela_ini))
+        colunas[chave] = sobrepoe | prioritaria
+
+    return pd.DataFrame(colunas, index=df.index)
@@ -0,0 +1,375 @@
+# ============================================================
+# comparar_exportacoes.py
+# ------------------------------------------------------------
+# Compara duas exportações tratadas do Monday (saída de
+# processar_excel) e classifica as atividades em adicionadas,
+# removidas e alteradas, com o detalhe campo a campo.
+# Também indica quais responsáveis precisam reimprimir a
+# Folha-Tarefa.
+#
+# Uso:
+#     python -m funcoes.comparar_exportacoes antiga.xlsx nova.xlsx
+#     python -m funcoes.comparar_exportacoes antiga.xlsx nova.xlsx --data 10/10/2025 --turno Noite
+#     python -m funcoes.comparar_exportacoes --verificar saida_tratada.xlsx
+# ============================================================
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+# Coluna que identifica a atividade no Monday
+CHAVE_PADRAO = "Name"
+
+# Colunas que mudam a cada exportação e não representam alteração real
+CAMPOS_IGNORADOS = ("Última atualização", "Controle de tempo")
+
+
+# ============================================================
+# Funções utilitárias
+# ============================================================
+
+def _ler_exportacao(exportacao) -> pd.DataFrame:
+    """Aceita o caminho de uma exportação tratada ou um DataFrame já carregado."""
+    if isinstance(exportacao, pd.DataFrame):
+        df = exportacao.copy()
+    else:
+        df = pd.read_excel(exportacao, dtype=str)
+    return df.fillna("").astype(str)
+
+
+def _identidades(df: pd.DataFrame, chave: str) -> np.ndarray:
+    """Identidade de cada linha (coluna chave sem espaços nas pontas)."""
+    if chave not in df.columns:
+        raise KeyError(f"Coluna de identificação '{chave}' não encontrada na exportação")
+    return df[chave].str.strip().to_numpy(dtype=object)
+
+
+def _indice_ocorrencia(*chaves) -> pd.MultiIndex:
+    """Índice único (chaves..., ordem de ocorrência) para casar linhas repetidas."""
+    chaves = [np.asarray(c) for c in chaves]
+    ocorrencia = pd.Series(np.zeros(len(chaves[0]))).groupby(chaves).cumcount().to_numpy()
+    return pd.MultiIndex.from_arrays(chaves + [ocorrencia])
+
+
+def _parear_linhas(ids_antiga, hash_antiga, ids_nova, hash_nova) -> tuple:
+    """
+    Pareia as linhas das duas exportações pela identidade.
+
+    Primeiro casam as linhas idênticas de mesma identidade, como multiconjunto
+    (reordenar atividades com o mesmo Name não gera diferença). As que sobram
+    são pareadas pela ordem de ocorrência dentro da identidade e contam como
+    alteradas; o restante é adicionado ou removido.
+
+    Retorna:
+        tuple: Posições (alteradas na antiga, alteradas na nova, removidas, adicionadas).
+    """
+    exatas_antiga = _indice_ocorrencia(ids_antiga, hash_antiga)
+    exatas_nova = _indice_ocorrencia(ids_nova, hash_nova)
+
+    sobra_antiga = np.flatnonzero(~exatas_antiga.isin(exatas_nova))
+    sobra_nova = np.flatnonzero(~exatas_nova.isin(exatas_antiga))
+
+    pares_antiga = _indice_ocorrencia(ids_antiga[sobra_antiga])
+    pares_nova = _indice_ocorrencia(ids_nova[sobra_nova])
+    comuns = pares_nova.intersection(pares_antiga, sort=False)
+
+    return (
+        sobra_antiga[pares_antiga.get_indexer(comuns)],
+        sobra_nova[pares_nova.get_indexer(comuns)],
+        sobra_antiga[~pares_antiga.isin(pares_nova)],
+        sobra_nova[~pares_nova.isin(pares_antiga)],
+    )
+
+
+def _hash_linhas(df: pd.DataFrame, campos: list) -> pd.Series:
+    """Gera um hash de 64 bits por linha considerando apenas os campos comparados."""
+    return pd.util.hash_pandas_object(df[campos], index=False)
+
+
+def _colunas_por_turno(data, turno: str, colunas_responsavel) -> dict:
+    """{coluna de encarregado: [turnos]} dos turnos considerados na reimpressão."""
+    from funcoes.calendario_turnos import carregar_calendario, coluna_responsavel
+
+    calendario = carregar_calendario()
+    turnos = [turno.upper()] if turno else list(calendario)
+
+    colunas = {}
+    for chave in turnos:
+        coluna = coluna_responsavel(calendario, chave)
+        if colunas_responsavel is None or coluna in colunas_responsavel:
+            colunas.setdefault(coluna, []).append(chave)
+    return colunas
+
+
+def _responsaveis_afetados(lados, colunas: dict, data=None) -> dict:
+    """
+    Lista, por coluna de encarregado, os responsáveis das linhas que mudaram.
+
+    Com `data`, a linha só conta se estiver na folha do turno nessa data
+    (antes da mudança, na exportação antiga, ou depois, na nova).
+    """
+    if data is not None:
+        from datetime import datetime, date
+        from funcoes.calendario_turnos import carregar_calendario, matriz_turnos
+        from funcoes.gerar_folhas import preparar_planilha
+
+        if not isinstance(data, date):
+            data = datetime.strptime(data, "%d/%m/%Y").date()
+        calendario = carregar_calendario()
+
+    reimprimir = {}
+    for coluna, turnos in colunas.items():
+        nomes = []
+        for df, posicoes in lados:
+            if coluna not in df.columns:
+                continue
+            linhas = df.loc[posicoes]
+            if data is not None:
+                matriz = matriz_turnos(preparar_planilha(linhas), data, calendario)
+                linhas = linhas[matriz[turnos].any(axis=1).to_numpy()]
+            nomes.append(linhas[coluna])
+        if not nomes:
+            continue
+        afetados = pd.concat(nomes).str.strip()
+        reimprimir[coluna] = sorted(set(afetados[afetados != ""]))
+    return reimprimir
+
+
+# ============================================================
+# Função principal
+# ============================================================
+
+def comparar_exportacoes(
+    antiga,
+    nova,
+    chave: str = CHAVE_PADRAO,
+    campos_ignorados=CAMPOS_IGNORADOS,
+    colunas_responsavel=None,
+    data=None,
+    turno: str = None,
+) -> dict:
+    """
+    Compara duas exportações tratadas em tempo linear.
+
+    Cada linha é reduzida a um hash; linhas idênticas com a mesma identidade
+    se cancelam (independente da ordem) e apenas as que sobram são
+    comparadas campo a campo.
+
+    Parâmetros:
+        antiga: Caminho (ou DataFrame) da exportação anterior.
+        nova: Caminho (ou DataFrame) da exportação atual.
+        chave (str): Coluna que identifica a atividade.
+        campos_ignorados: Colunas desconsideradas na comparação.
+        colunas_responsavel: Colunas de encarregado usadas para a reimpressão.
+                             Padrão: as colunas dos turnos de turnos.py.
+        data (opcional): Data da Folha-Tarefa (DD/MM/AAAA ou date). Se
+                         informada, só entram na reimpressão os responsáveis
+                         cuja folha dessa data ganhou, perdeu ou teve
+                         alterada alguma atividade (filtro de turno de
+                         turnos.py). Sem data, qualquer diferença conta.
+        turno (str, opcional): Limita a reimpressão a um turno (exige `data`).
+
+    Retorna:
+        dict: {
+            "adicionadas": DataFrame com as linhas novas,
+            "removidas": DataFrame com as linhas que saíram,
+            "alteradas": DataFrame [chave, "Campo", "Antes", "Depois"],
+            "reimprimir": {coluna_responsavel: [responsáveis afetados]},
+        }
+    """
+    df_antiga = _ler_exportacao(antiga).reset_index(drop=True)
+    df_nova = _ler_exportacao(nova).reset_index(drop=True)
+
+    # Campos comparados: presentes nas duas exportações, na ordem da nova
+    colunas_antiga = set(df_antiga.columns)
+    campos = [
+        c for c in df_nova.columns
+        if c in colunas_antiga and c not in campos_ignorados
+    ]
+
+    # ------------------------------------------------------------
+    # Classificação por identidade e hash (operações de conjunto)
+    # ------------------------------------------------------------
+    ids_antiga = _identidades(df_antiga, chave)
+    ids_nova = _identidades(df_nova, chave)
+
+    pos_antes, pos_depois, pos_removidas, pos_adicionadas = _parear_linhas(
+        ids_antiga, _hash_linhas(df_antiga, campos).to_numpy(),
+        ids_nova, _hash_linhas(df_nova, campos).to_numpy(),
+    )
+
+    # Atividades repetidas que mudaram recebem um sufixo pela ordem de
+    # ocorrência (ex.: 'ID', 'ID#1'), para não se misturarem no relatório
+    ids_alteradas = pd.Series(ids_nova[pos_depois])
+    ocorrencia = ids_alteradas.groupby(ids_alteradas).cumcount()
+    ids_alteradas = ids_alteradas.where(ocorrencia == 0, ids_alteradas + "#" + ocorrencia.astype(str))
+    ids_alteradas = ids_alteradas.to_numpy(dtype=object)
+
+    # ------------------------------------------------------------
+    # Diferenças campo a campo (somente nas linhas alteradas)
+    # ------------------------------------------------------------
+    antes = df_antiga.loc[pos_antes, campos].to_numpy()
+    depois = df_nova.loc[pos_depois, campos].to_numpy()
+    linhas, colunas = np.nonzero(antes != depois)
+
+    alteradas = pd.DataFrame({
+        chave: ids_alteradas[linhas],
+        "Campo": np.asarray(campos, dtype=object)[colunas],
+        "Antes": antes[linhas, colunas],
+        "Depois": depois[linhas, colunas],
+    })
+
+    adicionadas = df_nova.loc[pos_adicionadas].reset_index(drop=True)
+    removidas = df_antiga.loc[pos_removidas].reset_index(drop=True)
+
+    # ------------------------------------------------------------
+    # Responsáveis cujas folhas precisam ser reimpressas
+    # (antes e depois, para cobrir trocas de encarregado)
+    # ------------------------------------------------------------
+    # Linhas que mudaram em cada lado: (exportação, posições)
+    lados = [
+        (df_nova, np.concatenate([pos_adicionadas, pos_depois])),
+        (df_antiga, np.concatenate([pos_removidas, pos_antes])),
+    ]
+
+    if data is None:
+        if turno is not None:
+            raise ValueError("Informe a data para limitar a reimpressão a um turno")
+        if colunas_responsavel is None:
+            from funcoes.calendario_turnos import carregar_calendario
+            colunas_responsavel = list(dict.fromkeys(
+                definicao["encarregado"] for definicao in carregar_calendario().values()
+            ))
+        reimprimir = _responsaveis_afetados(lados, {coluna: None for coluna in colunas_responsavel})
+    else:
+        reimprimir = _responsaveis_afetados(
+            lados, _colunas_por_turno(data, turno, colunas_responsavel), data
+        )
+
+    return {
+        "adicionadas": adicionadas,
+        "removidas": removidas,
+        "alteradas": alteradas,
+        "reimprimir": reimprimir,
+    }
+
+
+# ============================================================
+# Relatório compacto
+# ============================================================
+
+def formatar_relatorio(relatorio: dict, chave: str = CHAVE_PADRAO) -> str:
+    """Monta um relatório de texto compacto a partir do resultado da comparação."""
+    adicionadas = relatorio["adicionadas"]
+    removidas = relatorio["removidas"]
+    alteradas = relatorio["alteradas"]
+
+    linhas = [
+        f"Adicionadas: {len(adicionadas)} | Removidas: {len(removidas)} | "
+        f"Alteradas: {alteradas[chave].nunique()}"
+    ]
+
+    if "Status" in set(alteradas["Campo"]):
+        atrasos = alteradas[
+            (alteradas["Campo"] == "Status") & (alteradas["Depois"].str.lower() == "atraso")
+        ]
+        if len(atrasos):
+            linhas.append(f"Passaram para Atraso: {len(atrasos)}")
+
+    for _, row in adicionadas.iterrows():
+        linhas.append(f"+ {row[chave]}  {row.get('Descrição', '')}".rstrip())
+
+    for _, row in removidas.iterrows():
+        linhas.append(f"- {row[chave]}  {row.get('Descrição', '')}".rstrip())
+
+    for id_atividade, grupo in alteradas.groupby(chave, sort=False):
+        deltas = "; ".join(
+            f"{campo}: {antes or '∅'} → {depois or '∅'}"
+            for campo, antes, depois in zip(grupo["Campo"], grupo["Antes"], grupo["Depois"])
+        )
+        linhas.append(f"~ {id_atividade}  {deltas}")
+
+    for coluna, nomes in relatorio["reimprimir"].items():
+        if nomes:
+            linhas.append(f"Reimprimir ({coluna}): {', '.join(nomes)}")
+
+    return "\n".join(linhas)
+
+
+# ============================================================
+# Verificação
+# ============================================================
+
+def verificar_estabilidade(exportacao, chave: str = CHAVE_PADRAO) -> list:
+    """
+    Compara a exportação com versões dela mesma que não têm alteração real
+    (linhas reordenadas, repetidas movidas para o topo) ou que têm apenas
+    uma remoção, e confere se o relatório é o esperado.
+
+    Retorna:
+        list: Descrição das falhas encontradas (vazia se tudo certo).
+    """
+    df = _ler_exportacao(exportacao).reset_index(drop=True)
+    repetidas = df[chave].str.strip().duplicated()
+
+    data = pd.to_datetime(df["Cronograma - Start"], errors="coerce", dayfirst=True).min()
+    por_data = {"data": data.date()} if pd.notna(data) else {}
+
+    casos = [
+        ("ordem invertida", df.iloc[::-1], {}, (0, 0, 0, 0)),
+        ("repetidas no topo", pd.concat([df[repetidas], df[~repetidas]]), {}, (0, 0, 0, 0)),
+        ("repetidas no topo (por data)", pd.concat([df[repetidas], df[~repetidas]]), por_data, (0, 0, 0, 0)),
+        ("primeira linha removida", df.iloc[1:], {}, (0, 1, 0, None)),
+    ]
+
+    falhas = []
+    for descricao, nova, opcoes, esperado in casos:
+        relatorio = comparar_exportacoes(df, nova, chave=chave, **opcoes)
+        obtido = (
+            len(relatorio["adicionadas"]),
+            len(relatorio["removidas"]),
+            relatorio["alteradas"][chave].nunique(),
+            sum(len(nomes) for nomes in relatorio["reimprimir"].values()),
+        )
+        if any(e is not None and e != o for e, o in zip(esperado, obtido)):
+            falhas.append(
+                f"{descricao}: adicionadas/removidas/alteradas/reimprimir = {obtido}, esperado {esperado}"
+            )
+    return falhas
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Diferenças entre duas exportações do Monday")
+    parser.add_argument("antiga", help="Exportação tratada anterior (.xlsx)")
+    parser.add_argument("nova", nargs="?", help="Exportação tratada atual (.xlsx)")
+    parser.add_argument("--chave", default=CHAVE_PADRAO, help="Coluna que identifica a atividade")
+    parser.add_argument("--data", help="Reimpressão só das Folhas-Tarefa desta data (DD/MM/AAAA)")
+    parser.add_argument("--turno", help="Reimpressão só deste turno (com --data)")
+    parser.add_argument(
+        "--verificar", action="store_true",
+        help="Confere que reordenar a exportação 'antiga' não gera diferenças",
+    )
+    args = parser.parse_args(argv)
+
+    if args.verificar:
+        falhas = verificar_estabilidade(args.antiga, chave=args.chave)
+        for falha in falhas:
+            print(f"FALHA {falha}")
+        print("OK" if not falhas else f"{len(falhas)} falha(s)")
+        return 1 if falhas else 0
+
+    if args.nova is None:
+        parser.error("informe a exportação nova (ou use --verificar)")
+
+    if args.turno and not args.data:
+        parser.error("--turno exige --data")
+
+    relatorio = comparar_exportacoes(
+        args.antiga, args.nova, chave=args.chave, data=args.data, turno=args.turno
+    )
+    print(formatar_relatorio(relatorio, chave=args.chave))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
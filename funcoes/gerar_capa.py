@@ -6,7 +6,6 @@
 # e gera a tabela de colaboradores com seus respectivos campos.
 # ============================================================
 import os
-import sys, io
 import locale
 import datetime
 from reportlab.lib import colors
@@ -14,17 +13,8 @@ from reportlab.lib.units import cm
 from reportlab.platypus import Image, Table, TableStyle, Paragraph, Spacer, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 
-# Suporte a caracteres UTF-8 no terminal
-try:
-    if sys.stdout:
-        sys.stdout.reconfigure(encoding="utf-8")
-except Exception:
-    # Sem console (modo Tkinter/--noconsole), apenas ignora
-    pass
-
-
-# Importa o dicionário de equipes externas
-from equipes import EQUIPES
+# Obs.: a configuração UTF-8 do terminal é feita pelo script principal
+# (configurar_saida_utf8), e não mais na importação deste módulo.
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -33,7 +23,7 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 # Função principal
 # ============================================================
 
-def gerar_capa(responsavel: str, data_escolhida: str, turno: str):
+def gerar_capa(responsavel: str, data_escolhida: str, turno: str, logo_path: str = None):
     """
     Monta os elementos da capa da Folha de Tarefa.
 
@@ -41,6 +31,8 @@ def gerar_capa(responsavel: str, data_escolhida: str, turno: str):
         responsavel (str): Nome do responsável pela equipe.
         data_escolhida (str): Data da planilha (formato DD/MM/YYYY).
         turno (str): Turno selecionado (ex.: 'MANHÃ', 'NOITE').
+        logo_path (str, opcional): Caminho do logo (ex.: versão reduzida do
+                                   perfil de saída). Padrão: imagens/logo.png.
 
     Retorna:
         list: Lista de elementos Flowable (tabela + espaçamento).
@@ -50,6 +42,9 @@ def gerar_capa(responsavel: str, data_escolhida: str, turno: str):
     # Mapeia o nome do responsável para a lista de colaboradores
     # (Ignora maiúsculas/minúsculas)
     # ------------------------------------------------------------
+    # Importa o dicionário de equipes externas só quando a capa é montada
+    from equipes import EQUIPES
+
     mapa_equipes = {k.lower(): v for k, v in EQUIPES.items()}
     colaboradores = mapa_equipes.get(responsavel.lower(), [])
 
@@ -64,7 +59,8 @@ def gerar_capa(responsavel: str, data_escolhida: str, turno: str):
         IMG_DIR = os.path.join(BASE_DIR, "..", "imagens")
 
         # Caminho completo do logo
-        logo_path = os.path.join(IMG_DIR, "logo.png")
+        if not logo_path:
+            logo_path = os.path.join(IMG_DIR, "logo.png")
 
         logo_img = Image(logo_path, width=3.5 * cm, height=2 * cm)
 
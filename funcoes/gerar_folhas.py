@@ -0,0 +1,163 @@
+# ============================================================
+# gerar_folhas.py
+# ------------------------------------------------------------
+# Etapas da geração das Folhas-Tarefa a partir da planilha
+# tratada: preparação (horas/datas), filtro do turno e um PDF
+# por responsável.
+# Usado pelo script principal (Excel do Monday) e pelo
+# histórico (snapshots gravados no SQLite).
+# ============================================================
+import os
+from time import monotonic
+from datetime import time
+
+import pandas as pd
+
+from funcoes.calendario_turnos import carregar_calendario, coluna_responsavel, matriz_turnos
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMG_DIR = os.path.join(BASE_DIR, "imagens")
+SAIDAS_DIR = os.path.join(BASE_DIR, "folhatarefa")
+
+
+# ============================================================
+# 🕓 Conversão de horas
+# ============================================================
+def converter_hora(valor):
+    """Converte texto de hora no formato HH:MM para objeto time."""
+    if pd.isna(valor) or str(valor).strip() == "":
+        return None
+    try:
+        horas, minutos = map(int, str(valor).split(":"))
+        return time(horas, minutos)
+    except Exception:
+        return None
+
+
+# ============================================================
+# 📥 Preparação da planilha
+# ============================================================
+def preparar_planilha(df):
+    """Converte horas, datas e valores nulos da planilha tratada para a filtragem."""
+    df = df.copy()
+
+    for col in ["Hora Início", "Hora Fim"]:
+        df[col] = df[col].apply(converter_hora)
+
+    # Tratamento de valores nulos
+    encarregados = [turno["encarregado"] for turno in carregar_calendario().values()]
+    for col in encarregados + ["Hora Início", "Hora Fim"]:
+        if col in df.columns:
+            df[col] = df[col].fillna("")
+
+    # Conversão de colunas de data
+    df["Cronograma - Start"] = pd.to_datetime(
+        df["Cronograma - Start"], errors="coerce", dayfirst=True
+    ).dt.date
+
+    df["Cronograma - End"] = pd.to_datetime(
+        df["Cronograma - End"], errors="coerce", dayfirst=True
+    ).dt.date
+
+    return df
+
+
+# ============================================================
+# 🔍 Aplicação do filtro de turno
+# ============================================================
+def filtrar_turno(df, data_input_dt, turno_escolhido, calendario=None):
+    """Mantém apenas as atividades do turno escolhido e lista as ignoradas.
+
+    A pertinência é calculada para todos os turnos de `turnos.py` de uma
+    vez (matriz atividade × turno); aqui só a coluna do turno escolhido é usada.
+    """
+    calendario = calendario or carregar_calendario()
+    matriz = matriz_turnos(df, data_input_dt, calendario)
+    df_filtrado = df[matriz[turno_escolhido.upper()]]
+
+    atividades_ignoradas = df[~df.index.isin(df_filtrado.index)]
+    for _, row in atividades_ignoradas.iterrows():
+        descricao = row.get("Descrição", "Sem descrição")
+        print(f"⚠️ Atividade ignorada (fora do turno): {descricao}")
+
+    return df_filtrado
+
+
+# ============================================================
+# 👷 Geração das folhas por responsável
+# ============================================================
+def gerar_folhas(
+    df,
+    data_input,
+    data_input_dt,
+    turno_escolhido,
+    notificar=None,
+    cancelar=None,
+    saidas_dir=SAIDAS_DIR,
+    img_dir=IMG_DIR,
+    sufixo="",
+):
+    """Gera um PDF de Folha-Tarefa para cada responsável do turno.
+
+    `notificar(evento)` recebe um evento {"etapa": "pdf", ...} a cada PDF
+    concluído; se o threading.Event `cancelar` for acionado, a geração para
+    entre um documento e outro. `sufixo` é acrescentado ao nome da pasta e
+    dos arquivos. Retorna a quantidade de PDFs gerados.
+    """
+    from reportlab.platypus import Image
+    from reportlab.lib.units import cm
+    from funcoes.montar_documento import gerar_elementos, construir_pdf
+    from funcoes.perfil_saida import PERFIL_PADRAO, imagens_do_perfil
+
+    # Configuração de imagens (reduzidas conforme o perfil de saída) e pastas
+    imagens = imagens_do_perfil(PERFIL_PADRAO, img_dir)
+    checkbox_img = Image(imagens["checkbox"], width=0.35 * cm, height=0.35 * cm)
+
+    pasta_nome = f"{data_input_dt.strftime('%d-%m-%Y')}_{turno_escolhido}{sufixo}"
+    output_dir = os.path.join(saidas_dir, f"Folhas-Tarefa {pasta_nome}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    col_responsavel = coluna_responsavel(carregar_calendario(), turno_escolhido)
+    if col_responsavel not in df.columns:
+        raise KeyError(f"Coluna '{col_responsavel}' (turno {turno_escolhido}) não encontrada na planilha")
+    responsaveis = [
+        r for r in sorted(set(df[col_responsavel].unique().tolist())) if r.strip()
+    ]
+
+    inicio = monotonic()
+    gerados = 0
+    for responsavel in responsaveis:
+        if cancelar is not None and cancelar.is_set():
+            print("⚠️ Geração cancelada pelo usuário.")
+            break
+
+        df_responsavel = df[df[col_responsavel].str.lower() == responsavel.lower()]
+        output_pdf = os.path.join(
+            output_dir, f"Folha_Tarefa_{responsavel}_{pasta_nome}.pdf"
+        )
+
+        # Atividades lidas sob demanda: cada tabela é montada só quando o
+        # ReportLab precisa dela e liberada depois de desenhada
+        atividades = (row.to_dict() for _, row in df_responsavel.iterrows())
+        elementos = gerar_elementos(
+            responsavel, data_input, turno_escolhido, atividades, df.columns, checkbox_img,
+            logo_path=imagens["logo"],
+        )
+        construir_pdf(output_pdf, elementos, perfil=PERFIL_PADRAO)
+        tamanho_kb = os.path.getsize(output_pdf) / 1024
+        print(f"✅ Folha-tarefa gerada para {responsavel}: {output_pdf} ({tamanho_kb:.0f} KB)")
+
+        gerados += 1
+        if notificar:
+            decorrido = monotonic() - inicio
+            notificar({
+                "etapa": "pdf",
+                "responsavel": responsavel,
+                "concluidos": gerados,
+                "total": len(responsaveis),
+                "decorrido": decorrido,
+                "eta": decorrido / gerados * (len(responsaveis) - gerados),
+            })
+
+    return gerados
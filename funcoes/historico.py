@@ -0,0 +1,652 @@
+# ============================================================
+# historico.py
+# ------------------------------------------------------------
+# Histórico local (SQLite) das exportações do Monday.
+# Cada planilha tratada vira um "snapshot" com data/hora de
+# captura. As linhas são guardadas uma única vez (pelo hash do
+# conteúdo) e os snapshots apenas as referenciam, então
+# exportações diárias quase iguais ocupam pouco espaço.
+# Permite consultar o que estava na folha de um responsável em
+# qualquer data e regenerar a Folha-Tarefa sem o Excel original.
+#
+# Uso:
+#     python -m funcoes.historico registrar saida_tratada.xlsx
+#     python -m funcoes.historico listar --de 01/10/2025 --ate 31/10/2025
+#     python -m funcoes.historico responsavel "Letícia" --de 14/10/2025 --turno Noite
+#     python -m funcoes.historico regenerar 14/10/2025 Noite --responsavel "Letícia"
+#     python -m funcoes.historico compactar --manter-dias 30
+# ============================================================
+import os
+import sys
+import json
+import zlib
+import sqlite3
+import hashlib
+import argparse
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HISTORICO_PADRAO = os.path.join(BASE_DIR, "historico.sqlite")
+
+# Folhas regeneradas ficam separadas das impressas (folhatarefa/Folhas-Tarefa ...)
+REGENERADAS_DIR = os.path.join(BASE_DIR, "folhatarefa", "regeneradas")
+
+# Snapshots mais recentes que isso são mantidos todos; dos mais antigos ficam
+# os usados para gerar folhas, o vigente no início de cada turno e o último de cada dia
+MANTER_DIAS = 30
+
+FORMATO_MOMENTO = "%Y-%m-%d %H:%M:%S"
+
+# Quantidade de parâmetros por consulta "IN (...)"
+TAMANHO_LOTE = 900
+
+# Cada snapshot guarda apenas a lista (ordenada) dos ids das linhas, comprimida.
+# Datas e responsáveis são propriedades do conteúdo da linha, então são
+# indexados uma única vez por linha distinta, e não uma vez por snapshot.
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id           INTEGER PRIMARY KEY,
+    capturado_em TEXT NOT NULL,
+    origem       TEXT,
+    colunas      TEXT NOT NULL,
+    atividades   INTEGER NOT NULL,
+    linhas       BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_snapshots_capturado ON snapshots (capturado_em);
+
+CREATE TABLE IF NOT EXISTS linhas (
+    id          INTEGER PRIMARY KEY,
+    hash        BLOB NOT NULL UNIQUE,
+    dados       TEXT NOT NULL,
+    data_inicio TEXT,
+    data_fim    TEXT
+);
+
+CREATE TABLE IF NOT EXISTS linha_responsaveis (
+    responsavel TEXT NOT NULL,
+    linha_id    INTEGER NOT NULL REFERENCES linhas (id) ON DELETE CASCADE,
+    coluna      TEXT NOT NULL,
+    PRIMARY KEY (responsavel, linha_id, coluna)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_linha_responsaveis_linha ON linha_responsaveis (linha_id);
+
+CREATE TABLE IF NOT EXISTS folhas (
+    data        TEXT NOT NULL,
+    turno       TEXT NOT NULL,
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    gerada_em   TEXT NOT NULL,
+    PRIMARY KEY (data, turno, gerada_em, snapshot_id)
+);
+CREATE INDEX IF NOT EXISTS ix_folhas_snapshot ON folhas (snapshot_id);
+
+CREATE TABLE IF NOT EXISTS manutencao (
+    chave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+"""
+
+
+# ============================================================
+# Funções utilitárias
+# ============================================================
+
+@contextmanager
+def abrir_historico(caminho: str = HISTORICO_PADRAO):
+    """Abre (criando se preciso) o banco do histórico; confirma e fecha ao sair."""
+    conn = sqlite3.connect(caminho)
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.executescript(ESQUEMA)
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _momento(valor, fim_do_dia: bool = False) -> str:
+    """
+    Normaliza datetime/date/texto (DD/MM/AAAA [HH:MM]) para o formato gravado no banco.
+
+    Com `fim_do_dia`, valores só com a data (sem hora) valem até 23:59:59.
+    """
+    if valor is None:
+        return datetime.now().strftime(FORMATO_MOMENTO)
+    if isinstance(valor, str):
+        for formato in ("%d/%m/%Y %H:%M", FORMATO_MOMENTO):
+            try:
+                return datetime.strptime(valor, formato).strftime(FORMATO_MOMENTO)
+            except ValueError:
+                continue
+        valor = _data(valor)
+    if not isinstance(valor, datetime):
+        valor = datetime.combine(valor, datetime.max.time() if fim_do_dia else datetime.min.time())
+    return valor.strftime(FORMATO_MOMENTO)
+
+
+def _data(valor) -> date:
+    """Normaliza date/datetime/texto DD/MM/AAAA para date."""
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    try:
+        return datetime.strptime(valor, "%d/%m/%Y").date()
+    except (TypeError, ValueError):
+        raise ValueError(f"Data/hora inválida: {valor!r} (use DD/MM/AAAA [HH:MM])")
+
+
+def _periodo(inicio, fim) -> tuple:
+    """Converte um período de datas (inclusivo) para limites de capturado_em."""
+    de = _momento(inicio) if inicio else "0000"
+    ate = _momento(fim, fim_do_dia=True) if fim else "9999"
+    return de, ate
+
+
+def _data_iso(serie: pd.Series) -> list:
+    """Converte datas DD/MM/AAAA para AAAA-MM-DD (None se inválida)."""
+    datas = pd.to_datetime(serie, errors="coerce", dayfirst=True)
+    return [None if pd.isna(d) else d.strftime("%Y-%m-%d") for d in datas]
+
+
+def _codificar_ids(ids) -> bytes:
+    """Ids em ordem → deltas int64 comprimidos (exportações seguidas compartilham sequências)."""
+    ids = np.asarray(ids, dtype="<i8")
+    return zlib.compress(np.diff(ids, prepend=0).astype("<i8").tobytes())
+
+
+def _decodificar_ids(blob: bytes) -> np.ndarray:
+    return np.cumsum(np.frombuffer(zlib.decompress(blob), dtype="<i8"))
+
+
+def _em_lotes(valores, tamanho: int = TAMANHO_LOTE):
+    valores = list(valores)
+    for i in range(0, len(valores), tamanho):
+        yield valores[i:i + tamanho]
+
+
+def _buscar_linhas(conn, ids, data_inicio=None, data_fim=None) -> dict:
+    """
+    Retorna {id: dados} das linhas informadas.
+
+    Com `data_inicio`/`data_fim`, mantém só as linhas cujo cronograma se
+    sobrepõe ao período, além das de status prioritário ('Atraso'/'Em
+    andamento'), que entram nas folhas de qualquer dia.
+    """
+    from funcoes.calendario_turnos import STATUS_PRIORITARIOS
+
+    filtro, extras = "", []
+    if data_inicio or data_fim:
+        condicoes = []
+        if data_fim:
+            condicoes.append("data_inicio <= ?")
+            extras.append(_data(data_fim).isoformat())
+        if data_inicio:
+            condicoes.append("data_fim >= ?")
+            extras.append(_data(data_inicio).isoformat())
+        prioritarios = ",".join("?" * len(STATUS_PRIORITARIOS))
+        filtro = (
+            f" AND (({' AND '.join(condicoes)})"
+            f" OR lower(trim(json_extract(dados, '$.Status'))) IN ({prioritarios}))"
+        )
+        extras.extend(STATUS_PRIORITARIOS)
+
+    encontradas = {}
+    for lote in _em_lotes(np.unique(ids).tolist()):
+        marcadores = ",".join("?" * len(lote))
+        cursor = conn.execute(
+            f"SELECT id, dados FROM linhas WHERE id IN ({marcadores}){filtro}",
+            lote + extras,
+        )
+        encontradas.update(cursor)
+    return encontradas
+
+
+# ============================================================
+# Gravação
+# ============================================================
+
+def registrar_snapshot(conn, df_tratado: pd.DataFrame, capturado_em=None, origem: str = None) -> int:
+    """
+    Acrescenta uma planilha tratada ao histórico.
+
+    Parâmetros:
+        conn: Conexão aberta com `abrir_historico`.
+        df_tratado (DataFrame): Planilha tratada (saída de processar_excel, lida como texto).
+        capturado_em: Data/hora do snapshot (padrão: agora).
+        origem (str, opcional): Nome do arquivo de origem.
+
+    Retorna:
+        int: Id do snapshot criado.
+    """
+    from funcoes.calendario_turnos import carregar_calendario
+
+    colunas = [str(c) for c in df_tratado.columns]
+    registros = df_tratado.astype(object).where(df_tratado.notna(), None)
+
+    dados = [
+        json.dumps(dict(zip(colunas, valores)), ensure_ascii=False, sort_keys=True)
+        for valores in registros.itertuples(index=False, name=None)
+    ]
+    hashes = [hashlib.blake2b(d.encode("utf-8"), digest_size=16).digest() for d in dados]
+
+    vazio = [None] * len(dados)
+    inicio = _data_iso(df_tratado["Cronograma - Start"]) if "Cronograma - Start" in df_tratado else vazio
+    fim = _data_iso(df_tratado["Cronograma - End"]) if "Cronograma - End" in df_tratado else vazio
+
+    # Responsáveis de cada linha (todas as colunas de encarregado do calendário)
+    encarregados = [
+        coluna for coluna in dict.fromkeys(t["encarregado"] for t in carregar_calendario().values())
+        if coluna in df_tratado.columns
+    ]
+    nomes = {
+        coluna: df_tratado[coluna].fillna("").astype(str).str.strip().str.lower().tolist()
+        for coluna in encarregados
+    }
+
+    with conn:
+        # Linhas já conhecidas (conteúdo idêntico em snapshots anteriores)
+        ids_por_hash = {}
+        for lote in _em_lotes(set(hashes)):
+            marcadores = ",".join("?" * len(lote))
+            cursor = conn.execute(f"SELECT hash, id FROM linhas WHERE hash IN ({marcadores})", lote)
+            ids_por_hash.update(cursor)
+
+        # Apenas as linhas novas ou alteradas são gravadas
+        for posicao, h in enumerate(hashes):
+            if h in ids_por_hash:
+                continue
+            linha_id = conn.execute(
+                "INSERT INTO linhas (hash, dados, data_inicio, data_fim) VALUES (?, ?, ?, ?)",
+                (h, dados[posicao], inicio[posicao], fim[posicao]),
+            ).lastrowid
+            ids_por_hash[h] = linha_id
+            conn.executemany(
+                "INSERT OR IGNORE INTO linha_responsaveis (responsavel, linha_id, coluna) VALUES (?, ?, ?)",
+                (
+                    (nomes[coluna][posicao], linha_id, coluna)
+                    for coluna in encarregados if nomes[coluna][posicao]
+                ),
+            )
+
+        snapshot_id = conn.execute(
+            "INSERT INTO snapshots (capturado_em, origem, colunas, atividades, linhas) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                _momento(capturado_em),
+                origem,
+                json.dumps(colunas, ensure_ascii=False),
+                len(hashes),
+                _codificar_ids([ids_por_hash[h] for h in hashes]),
+            ),
+        ).lastrowid
+
+    return snapshot_id
+
+
+def registrar_folha(conn, data, turno: str, snapshot_id: int, gerada_em=None) -> None:
+    """Anota que as Folhas-Tarefa de `data`/`turno` foram geradas a partir do snapshot."""
+    with conn:
+        conn.execute(
+            "INSERT OR IGNORE INTO folhas (data, turno, snapshot_id, gerada_em) VALUES (?, ?, ?, ?)",
+            (_data(data).isoformat(), turno.upper(), snapshot_id, _momento(gerada_em)),
+        )
+
+
+def compactar(conn, manter_dias: int = MANTER_DIAS, agora=None, calendario: dict = None) -> int:
+    """
+    Remove snapshots antigos que não servem para regenerar nenhuma folha.
+
+    Dos snapshots com mais de `manter_dias` dias ficam: os registrados em
+    `folhas` (usados para gerar folhas), o vigente no início de cada turno
+    do calendário e o último de cada dia. Depois remove as linhas órfãs.
+
+    Retorna:
+        int: Quantidade de snapshots removidos.
+    """
+    if calendario is None:
+        from funcoes.calendario_turnos import carregar_calendario
+        calendario = carregar_calendario()
+
+    limite = (datetime.now() if agora is None else agora) - timedelta(days=manter_dias)
+    limite_txt = limite.strftime(FORMATO_MOMENTO)
+
+    antigos = conn.execute(
+        "SELECT id, capturado_em FROM snapshots WHERE capturado_em < ? ORDER BY capturado_em, id",
+        (limite_txt,),
+    ).fetchall()
+    if not antigos:
+        return 0
+
+    manter = {snapshot_id for (snapshot_id,) in conn.execute("SELECT DISTINCT snapshot_id FROM folhas")}
+    manter.update({capturado_em[:10]: snapshot_id for snapshot_id, capturado_em in antigos}.values())
+
+    # Vigente no início de cada turno (mesma regra de snapshot_vigente)
+    momentos = [capturado_em for _, capturado_em in antigos]
+    dia = date.fromisoformat(momentos[0][:10])
+    while dia <= limite.date():
+        for turno in calendario.values():
+            inicio_turno = datetime.combine(dia, turno["inicio"]).strftime(FORMATO_MOMENTO)
+            posicao = bisect_right(momentos, inicio_turno) - 1
+            if inicio_turno < limite_txt and posicao >= 0:
+                manter.add(antigos[posicao][0])
+        dia += timedelta(days=1)
+
+    remover = [(snapshot_id,) for snapshot_id, _ in antigos if snapshot_id not in manter]
+
+    with conn:
+        conn.executemany("DELETE FROM snapshots WHERE id = ?", remover)
+
+        if remover:
+            usados = [_decodificar_ids(blob) for (blob,) in conn.execute("SELECT linhas FROM snapshots")]
+            usados = np.unique(np.concatenate(usados)) if usados else np.array([], dtype="<i8")
+            todos = np.fromiter((i for (i,) in conn.execute("SELECT id FROM linhas")), dtype="<i8")
+            orfas = np.setdiff1d(todos, usados, assume_unique=True)
+            conn.executemany("DELETE FROM linhas WHERE id = ?", ((int(i),) for i in orfas))
+
+    if remover:
+        conn.execute("VACUUM")
+    return len(remover)
+
+
+def compactar_diario(conn, agora=None) -> int:
+    """
+    Executa `compactar` no máximo uma vez por dia (a compactação e o VACUUM
+    ficam fora das demais gerações do dia).
+
+    Retorna:
+        int: Snapshots removidos, ou None se já foi compactado hoje.
+    """
+    agora = datetime.now() if agora is None else agora
+    hoje = agora.strftime("%Y-%m-%d")
+
+    linha = conn.execute("SELECT valor FROM manutencao WHERE chave = 'ultima_compactacao'").fetchone()
+    if linha and linha[0] == hoje:
+        return None
+
+    removidos = compactar(conn, agora=agora)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO manutencao (chave, valor) VALUES ('ultima_compactacao', ?)", (hoje,)
+        )
+    return removidos
+
+
+# ============================================================
+# Consultas
+# ============================================================
+
+def listar_snapshots(conn, inicio=None, fim=None) -> pd.DataFrame:
+    """Lista os snapshots capturados no período (datas inclusivas)."""
+    return pd.read_sql_query(
+        "SELECT id, capturado_em, origem, atividades FROM snapshots "
+        "WHERE capturado_em BETWEEN ? AND ? ORDER BY capturado_em",
+        conn,
+        params=_periodo(inicio, fim),
+    )
+
+
+def snapshot_vigente(conn, momento) -> int:
+    """Retorna o id do último snapshot capturado até `momento` (ou None)."""
+    linha = conn.execute(
+        "SELECT id FROM snapshots WHERE capturado_em <= ? ORDER BY capturado_em DESC, id DESC LIMIT 1",
+        (_momento(momento),),
+    ).fetchone()
+    return linha[0] if linha else None
+
+
+def snapshot_da_folha(conn, data, turno: str, calendario: dict = None) -> tuple:
+    """
+    Retorna o snapshot que gerou as Folhas-Tarefa de `data`/`turno`.
+
+    Usa o registro da última geração (tabela `folhas`); sem registro, usa o
+    snapshot vigente no início do turno.
+
+    Retorna:
+        tuple: (snapshot_id ou None, True se veio do registro de geração).
+    """
+    linha = conn.execute(
+        "SELECT snapshot_id FROM folhas WHERE data = ? AND turno = ? "
+        "ORDER BY gerada_em DESC, snapshot_id DESC LIMIT 1",
+        (_data(data).isoformat(), turno.upper()),
+    ).fetchone()
+    if linha:
+        return linha[0], True
+
+    if calendario is None:
+        from funcoes.calendario_turnos import carregar_calendario
+        calendario = carregar_calendario()
+    inicio_turno = datetime.combine(_data(data), calendario[turno.upper()]["inicio"])
+    return snapshot_vigente(conn, inicio_turno), False
+
+
+def carregar_snapshot(conn, snapshot_id: int, data_inicio=None, data_fim=None) -> pd.DataFrame:
+    """
+    Reconstrói a planilha tratada de um snapshot (mesmas colunas e ordem).
+
+    Com `data_inicio`/`data_fim`, retorna só as atividades que podem entrar
+    nas folhas do período (cronograma sobreposto ou status prioritário).
+    """
+    linha = conn.execute(
+        "SELECT colunas, linhas FROM snapshots WHERE id = ?", (snapshot_id,)
+    ).fetchone()
+    if linha is None:
+        raise LookupError(f"Snapshot {snapshot_id} não encontrado no histórico")
+    colunas = json.loads(linha[0])
+    ids = _decodificar_ids(linha[1])
+
+    dados = _buscar_linhas(conn, ids, data_inicio, data_fim)
+    registros = [json.loads(dados[i]) for i in ids.tolist() if i in dados]
+    return pd.DataFrame.from_records(registros, columns=colunas)
+
+
+def historico_responsavel(conn, responsavel: str, inicio=None, fim=None, turno: str = None) -> pd.DataFrame:
+    """
+    Lista as atividades que estavam na Folha-Tarefa de um responsável em cada
+    data do período (datas inclusivas; padrão: hoje).
+
+    Para cada data e turno usa o snapshot que gerou a folha (o mesmo de
+    `regenerar_folhas`) e aplica o filtro de turno do calendário.
+
+    Parâmetros:
+        responsavel (str): Nome do encarregado.
+        inicio, fim: Datas das folhas (DD/MM/AAAA ou date).
+        turno (str, opcional): Consulta apenas este turno.
+
+    Retorna:
+        DataFrame: Colunas "data", "turno", "snapshot" e os campos da atividade.
+    """
+    from funcoes.calendario_turnos import carregar_calendario, matriz_turnos
+    from funcoes.gerar_folhas import preparar_planilha
+
+    calendario = carregar_calendario()
+    if turno is not None:
+        if turno.upper() not in calendario:
+            raise KeyError(f"Turno '{turno}' não definido no calendário de turnos")
+        calendario = {turno.upper(): calendario[turno.upper()]}
+
+    inicio = _data(inicio or fim or date.today())
+    fim = _data(fim or inicio)
+    nome = responsavel.strip().lower()
+
+    # Linhas (em qualquer snapshot) atribuídas ao responsável, por coluna de encarregado
+    ids_por_coluna = {}
+    for linha_id, coluna in conn.execute(
+        "SELECT linha_id, coluna FROM linha_responsaveis WHERE responsavel = ?", (nome,)
+    ):
+        ids_por_coluna.setdefault(coluna, []).append(linha_id)
+
+    encontrados = []
+    dia = inicio
+    while dia <= fim and ids_por_coluna:
+        for chave, definicao in calendario.items():
+            ids_responsavel = ids_por_coluna.get(definicao["encarregado"])
+            if not ids_responsavel:
+                continue
+
+            snapshot_id, _ = snapshot_da_folha(conn, dia, chave, calendario)
+            if snapshot_id is None:
+                continue
+
+            # Só as linhas do responsável que podem cair nesse dia/turno
+            # (um dia antes e depois cobre as viradas de madrugada)
+            blob, colunas = conn.execute(
+                "SELECT linhas, colunas FROM snapshots WHERE id = ?", (snapshot_id,)
+            ).fetchone()
+            ids = _decodificar_ids(blob)
+            ids = ids[np.isin(ids, ids_responsavel)]
+            dados = _buscar_linhas(conn, ids, dia - timedelta(days=1), dia + timedelta(days=1))
+            if not dados:
+                continue
+
+            df = pd.DataFrame.from_records(
+                [json.loads(dados[i]) for i in ids.tolist() if i in dados],
+                columns=json.loads(colunas),
+            )
+            no_turno = matriz_turnos(preparar_planilha(df), dia, calendario)[chave]
+            df = df[no_turno.to_numpy()]
+            if df.empty:
+                continue
+
+            df.insert(0, "snapshot", snapshot_id)
+            df.insert(0, "turno", definicao["nome"])
+            df.insert(0, "data", dia.strftime("%d/%m/%Y"))
+            encontrados.append(df)
+        dia += timedelta(days=1)
+
+    if not encontrados:
+        return pd.DataFrame()
+    return pd.concat(encontrados, ignore_index=True)
+
+
+# ============================================================
+# Regeneração de Folhas-Tarefa
+# ============================================================
+
+def regenerar_folhas(
+    conn,
+    data: str,
+    turno: str,
+    responsavel: str = None,
+    momento=None,
+    saidas_dir: str = REGENERADAS_DIR,
+) -> int:
+    """
+    Regenera as Folhas-Tarefa de uma data/turno passados a partir do histórico.
+
+    Parâmetros:
+        data (str): Data da folha (DD/MM/AAAA).
+        turno (str): Nome do turno (ver turnos.py).
+        responsavel (str, opcional): Gera apenas a folha deste responsável.
+        momento (opcional): Usa o último snapshot até este momento. Padrão:
+                            o snapshot que gerou a folha (ou, sem registro,
+                            o vigente no início do turno).
+        saidas_dir (str): Pasta de saída. As pastas e arquivos levam o sufixo
+                          "_snapshot<id>", sem sobrescrever as folhas impressas.
+
+    Retorna:
+        int: Quantidade de PDFs gerados.
+    """
+    from funcoes.gerar_folhas import preparar_planilha, filtrar_turno, gerar_folhas
+    from funcoes.calendario_turnos import carregar_calendario, coluna_responsavel
+
+    calendario = carregar_calendario()
+    turno = turno.upper()
+    if turno not in calendario:
+        raise KeyError(f"Turno '{turno}' não definido no calendário de turnos")
+
+    data_dt = datetime.strptime(data, "%d/%m/%Y").date()
+    if momento is not None:
+        snapshot_id = snapshot_vigente(conn, momento)
+        descricao = f"até {_momento(momento)}"
+    else:
+        snapshot_id, registrada = snapshot_da_folha(conn, data_dt, turno, calendario)
+        descricao = "usado na geração" if registrada else "vigente no início do turno"
+    if snapshot_id is None:
+        raise LookupError(f"Nenhum snapshot no histórico para {data} {turno}")
+
+    # Só as atividades que podem cair no turno (um dia antes e depois cobre as viradas)
+    df = carregar_snapshot(conn, snapshot_id, data_dt - timedelta(days=1), data_dt + timedelta(days=1))
+    df = preparar_planilha(df)
+    df = filtrar_turno(df, data_dt, turno, calendario)
+
+    if responsavel:
+        coluna = coluna_responsavel(calendario, turno)
+        df = df[df[coluna].str.strip().str.lower() == responsavel.strip().lower()]
+
+    print(f"🗄️ Usando snapshot {snapshot_id} ({descricao})")
+    return gerar_folhas(
+        df, data, data_dt, turno, saidas_dir=saidas_dir, sufixo=f"_snapshot{snapshot_id}"
+    )
+
+
+# ============================================================
+# Linha de comando
+# ============================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Histórico de exportações da Folha-Tarefa")
+    parser.add_argument("--banco", default=HISTORICO_PADRAO, help="Arquivo SQLite do histórico")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    p = comandos.add_parser("registrar", help="Acrescenta uma planilha tratada ao histórico")
+    p.add_argument("planilha", help="Planilha tratada por processar_excel (.xlsx)")
+    p.add_argument("--momento", help="Data/hora do snapshot (DD/MM/AAAA HH:MM); padrão: agora")
+
+    p = comandos.add_parser("listar", help="Lista os snapshots do período")
+    p.add_argument("--de")
+    p.add_argument("--ate")
+
+    p = comandos.add_parser("responsavel", help="Folhas-Tarefa de um responsável no período")
+    p.add_argument("nome")
+    p.add_argument("--de", help="Data da folha (DD/MM/AAAA); padrão: hoje")
+    p.add_argument("--ate", help="Última data da folha (DD/MM/AAAA); padrão: --de")
+    p.add_argument("--turno")
+
+    p = comandos.add_parser("regenerar", help="Regenera Folhas-Tarefa passadas")
+    p.add_argument("data", help="DD/MM/AAAA")
+    p.add_argument("turno")
+    p.add_argument("--responsavel")
+    p.add_argument("--momento", help="Usa o último snapshot até DD/MM/AAAA HH:MM")
+    p.add_argument("--saida", default=REGENERADAS_DIR, help="Pasta das folhas regeneradas")
+
+    p = comandos.add_parser("compactar", help="Remove snapshots antigos que não geraram folhas")
+    p.add_argument("--manter-dias", type=int, default=MANTER_DIAS)
+
+    args = parser.parse_args(argv)
+
+    with abrir_historico(args.banco) as conn:
+        if args.comando == "registrar":
+            df = pd.read_excel(args.planilha, dtype=str)
+            snapshot_id = registrar_snapshot(
+                conn, df, capturado_em=args.momento, origem=os.path.basename(args.planilha)
+            )
+            print(f"🗄️ Snapshot {snapshot_id} registrado com {len(df)} atividades")
+        elif args.comando == "listar":
+            print(listar_snapshots(conn, args.de, args.ate).to_string(index=False))
+        elif args.comando == "responsavel":
+            df = historico_responsavel(conn, args.nome, args.de, args.ate, args.turno)
+            if df.empty:
+                print("Nenhuma atividade encontrada.")
+            else:
+                campos = [c for c in ("data", "turno", "snapshot", "Name", "Status", "Descrição") if c in df]
+                print(df[campos].to_string(index=False))
+        elif args.comando == "regenerar":
+            gerados = regenerar_folhas(
+                conn, args.data, args.turno, args.responsavel, args.momento, args.saida
+            )
+            print(f"✅ {gerados} Folha(s)-Tarefa regenerada(s)")
+        elif args.comando == "compactar":
+            removidos = compactar(conn, args.manter_dias)
+            print(f"🧹 {removidos} snapshot(s) removido(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
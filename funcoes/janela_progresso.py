@@ -0,0 +1,134 @@
+# ============================================================
+# janela_progresso.py
+# ------------------------------------------------------------
+# Janela de progresso da geração das Folhas-Tarefa.
+# A geração roda em uma thread de trabalho; a interface (Tk)
+# continua na thread principal e recebe os eventos por uma
+# fila, atualizando a barra de progresso sem travar.
+# ============================================================
+import queue
+import threading
+from tkinter import Tk, Label, Button, StringVar, messagebox
+from tkinter import ttk
+
+# Intervalo de leitura da fila de eventos (ms)
+INTERVALO_ATUALIZACAO = 100
+
+# Parte da barra reservada para cada etapa (o restante é dos PDFs)
+PROGRESSO_ETAPAS = {"leitura": 10, "historico": 15, "filtro": 20}
+
+
+def _formatar_tempo(segundos) -> str:
+    """Formata segundos como MM:SS."""
+    if segundos is None:
+        return "--:--"
+    minutos, segundos = divmod(int(round(segundos)), 60)
+    return f"{minutos:02d}:{segundos:02d}"
+
+
+def _descrever_evento(evento: dict) -> str:
+    """Texto exibido na janela para cada evento da geração."""
+    etapa = evento["etapa"]
+    if etapa == "leitura":
+        return f"Planilha carregada: {evento['linhas']} atividades"
+    if etapa == "historico":
+        return f"Registrando {evento['linhas']} atividades no histórico..."
+    if etapa == "filtro":
+        return f"Atividades no turno: {evento['filtradas']} de {evento['total']}"
+    if etapa == "pdf":
+        return (
+            f"PDF {evento['concluidos']}/{evento['total']}: {evento['responsavel']}\n"
+            f"Decorrido {_formatar_tempo(evento['decorrido'])} · "
+            f"Restante {_formatar_tempo(evento['eta'])}"
+        )
+    if etapa == "fim":
+        situacao = "cancelada" if evento["cancelado"] else "concluída"
+        return (
+            f"Geração {situacao}: {evento['gerados']} PDF(s) "
+            f"em {_formatar_tempo(evento['decorrido'])}"
+        )
+    return ""
+
+
+def executar_com_progresso(tarefa, titulo: str = "Gerando Folhas-Tarefa") -> dict:
+    """
+    Executa `tarefa` em segundo plano exibindo uma janela de progresso.
+
+    Parâmetros:
+        tarefa: Função chamada como `tarefa(notificar, cancelar)`, onde
+                `notificar(evento: dict)` envia eventos para a janela e
+                `cancelar` é um threading.Event verificado entre documentos.
+                Deve enviar um evento {"etapa": "fim", ...} ao terminar.
+        titulo (str): Título da janela.
+
+    Retorna:
+        dict: Último evento recebido ("fim" ou "erro").
+    """
+    eventos = queue.Queue()
+    cancelar = threading.Event()
+    resultado = {}
+
+    def trabalhar():
+        try:
+            tarefa(eventos.put, cancelar)
+        except Exception as e:
+            eventos.put({"etapa": "erro", "mensagem": str(e)})
+
+    root = Tk()
+    root.title(titulo)
+    root.resizable(False, False)
+
+    texto = StringVar(root, value="Carregando planilha...")
+    Label(root, textvariable=texto, justify="left", width=50, anchor="w").pack(padx=10, pady=(10, 5))
+
+    barra = ttk.Progressbar(root, orient="horizontal", length=360, mode="determinate", maximum=100)
+    barra.pack(padx=10, pady=5)
+
+    def solicitar_cancelamento():
+        if resultado:
+            root.destroy()
+            return
+        cancelar.set()
+        botao.config(state="disabled")
+        texto.set(texto.get().split("\n")[0] + "\nCancelando após o documento atual...")
+
+    botao = Button(root, text="Cancelar", command=solicitar_cancelamento)
+    botao.pack(pady=(5, 10))
+    root.protocol("WM_DELETE_WINDOW", solicitar_cancelamento)
+
+    def processar_eventos():
+        try:
+            while True:
+                evento = eventos.get_nowait()
+                etapa = evento["etapa"]
+
+                if etapa == "erro":
+                    resultado.update(evento)
+                    messagebox.showerror("Erro na geração", evento["mensagem"], parent=root)
+                    root.destroy()
+                    return
+
+                if etapa in PROGRESSO_ETAPAS:
+                    barra["value"] = PROGRESSO_ETAPAS[etapa]
+                elif etapa == "pdf":
+                    inicio = PROGRESSO_ETAPAS["filtro"]
+                    barra["value"] = inicio + (100 - inicio) * evento["concluidos"] / evento["total"]
+
+                if not cancelar.is_set() or etapa == "fim":
+                    texto.set(_descrever_evento(evento))
+
+                if etapa == "fim":
+                    resultado.update(evento)
+                    if not evento["cancelado"]:
+                        barra["value"] = 100
+                    botao.config(text="Fechar", state="normal")
+                    return
+        except queue.Empty:
+            pass
+        root.after(INTERVALO_ATUALIZACAO, processar_eventos)
+
+    threading.Thread(target=trabalhar, name="geracao", daemon=True).start()
+    root.after(INTERVALO_ATUALIZACAO, processar_eventos)
+    root.mainloop()
+
+    return resultado
@@ -0,0 +1,137 @@
+# ============================================================
+# medir_importacao.py
+# ------------------------------------------------------------
+# Mede o tempo de importação do script principal usando
+# `python -X importtime` e compara com o orçamento definido.
+# Falha (código de saída 1) se o orçamento for estourado ou se
+# algum módulo pesado voltar a ser importado na inicialização.
+#
+# Uso:
+#     python -m funcoes.medir_importacao [--execucoes N] [--top N]
+# ============================================================
+import os
+import sys
+import argparse
+import subprocess
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulo medido (o mesmo que é executado pelo .exe)
+MODULO_INICIAL = "gerar_folha_tarefa"
+
+# Orçamento de importação do módulo inicial, em milissegundos
+ORCAMENTO_MS = 100
+
+# Módulos que só podem ser carregados na etapa que precisa deles
+MODULOS_PROIBIDOS = ("pandas", "numpy", "reportlab", "openpyxl", "tkcalendar", "babel", "PIL")
+
+
+# ============================================================
+# Funções utilitárias
+# ============================================================
+
+def medir_importacao(modulo: str = MODULO_INICIAL) -> list:
+    """
+    Importa o módulo em um processo novo com `-X importtime`.
+
+    Parâmetros:
+        modulo (str): Nome do módulo a importar.
+
+    Retorna:
+        list: Tuplas (nome, proprio_us, acumulado_us, nivel) na ordem do relatório
+              do interpretador. `nivel` 0 indica import de primeiro nível.
+    """
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(f"Falha ao importar '{modulo}':\n{resultado.stderr}")
+
+    linhas = []
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith("import time:"):
+            continue
+        partes = linha[len("import time:"):].split("|")
+        if len(partes) != 3 or not partes[0].strip().isdigit():
+            continue  # cabeçalho
+        nome = partes[2].rstrip()
+        nivel = (len(nome) - len(nome.lstrip())) // 2
+        linhas.append((nome.strip(), int(partes[0]), int(partes[1]), nivel))
+    return linhas
+
+
+def tempo_modulo_ms(linhas: list, modulo: str = MODULO_INICIAL) -> float:
+    """Retorna o tempo acumulado (ms) de importação do módulo informado."""
+    for nome, _, acumulado, nivel in linhas:
+        if nome == modulo and nivel == 0:
+            return acumulado / 1000
+    raise ValueError(f"Módulo '{modulo}' não encontrado no relatório de importação")
+
+
+def modulos_importados_por(linhas: list, modulo: str = MODULO_INICIAL) -> list:
+    """
+    Lista os módulos importados (direta ou indiretamente) pelo módulo informado.
+
+    O relatório do `-X importtime` lista os filhos antes do pai, então os
+    módulos de um import de primeiro nível são as linhas com nível > 0
+    imediatamente anteriores a ele.
+    """
+    filhos = []
+    for nome, _, _, nivel in linhas:
+        if nivel == 0:
+            if nome == modulo:
+                return filhos
+            filhos = []
+        else:
+            filhos.append(nome)
+    return []
+
+
+# ============================================================
+# Função principal
+# ============================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Orçamento de tempo de importação da Folha-Tarefa")
+    parser.add_argument("--execucoes", type=int, default=5, help="Número de medições (usa a menor)")
+    parser.add_argument("--top", type=int, default=15, help="Quantidade de módulos no detalhamento")
+    args = parser.parse_args(argv)
+
+    medicoes = [medir_importacao() for _ in range(max(1, args.execucoes))]
+    melhor = min(medicoes, key=tempo_modulo_ms)
+    total_ms = tempo_modulo_ms(melhor)
+
+    # Detalhamento: módulos mais caros carregados pelo script principal
+    filhos = set(modulos_importados_por(melhor))
+    detalhes = sorted(
+        (l for l in melhor if l[0] in filhos or (l[0] == MODULO_INICIAL and l[3] == 0)),
+        key=lambda l: l[2],
+        reverse=True,
+    )
+    print(f"{'acumulado (ms)':>15} {'próprio (ms)':>13}  módulo")
+    for nome, proprio, acumulado, nivel in detalhes[:args.top]:
+        print(f"{acumulado / 1000:15.1f} {proprio / 1000:13.1f}  {'  ' * nivel}{nome}")
+
+    ok = True
+    print(f"\n⏱️ Importação de '{MODULO_INICIAL}': {total_ms:.1f} ms (orçamento: {ORCAMENTO_MS} ms)")
+    if total_ms > ORCAMENTO_MS:
+        print("❌ Orçamento de importação estourado.")
+        ok = False
+
+    proibidos = sorted(
+        n for n in filhos if n.split(".")[0] in MODULOS_PROIBIDOS
+    )
+    if proibidos:
+        print(f"❌ Módulos pesados importados na inicialização: {', '.join(proibidos)}")
+        ok = False
+
+    if ok:
+        print("✅ Inicialização dentro do orçamento.")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
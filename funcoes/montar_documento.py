@@ -0,0 +1,177 @@
+# ============================================================
+# montar_documento.py
+# ------------------------------------------------------------
+# Responsável por montar o PDF de um responsável: capa, tabelas
+# das atividades e tabelas extras em branco.
+# Os elementos são produzidos sob demanda por um gerador e
+# liberados assim que o ReportLab os posiciona na página, de
+# modo que a memória por documento não cresce com o número de
+# atividades.
+# ============================================================
+import sys
+import argparse
+from itertools import chain
+from reportlab.platypus import SimpleDocTemplate, Spacer, PageBreak
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.units import cm
+
+from funcoes.layout import build_tabela
+from funcoes.gerar_capa import gerar_capa
+from funcoes.perfil_saida import PERFIL_PADRAO, aplicar_perfil
+
+# Quantidade de tabelas por página e de tabelas extras em branco
+TABELAS_POR_PAGINA = 4
+TABELAS_EXTRAS = 3
+
+
+# ============================================================
+# Lista alimentada sob demanda
+# ============================================================
+
+class FlowablesSobDemanda(list):
+    """
+    Lista de flowables abastecida aos poucos a partir de um gerador.
+
+    O `doc.build` do ReportLab consome a lista pela frente (`flowables[0]`,
+    `del flowables[0]`) e devolve pedaços divididos com `insert(0, ...)`.
+    Aqui só ficam em memória os próximos `antecipacao` elementos; os já
+    desenhados são descartados pelo próprio ReportLab.
+    """
+
+    def __init__(self, gerador, antecipacao: int = 8):
+        super().__init__()
+        self._gerador = iter(gerador)
+        self._antecipacao = antecipacao
+
+    def _abastecer(self):
+        while self._gerador is not None and list.__len__(self) < self._antecipacao:
+            try:
+                self.append(next(self._gerador))
+            except StopIteration:
+                self._gerador = None
+
+    def __len__(self):
+        self._abastecer()
+        return list.__len__(self)
+
+    def __getitem__(self, indice):
+        self._abastecer()
+        return list.__getitem__(self, indice)
+
+
+# ============================================================
+# Geração dos elementos
+# ============================================================
+
+def gerar_elementos(responsavel, data_input, turno, atividades, colunas, checkbox_img, logo_path=None):
+    """
+    Produz, um a um, os flowables da Folha-Tarefa de um responsável.
+
+    Parâmetros:
+        responsavel (str): Nome do responsável.
+        data_input (str): Data da folha (DD/MM/YYYY).
+        turno (str): Turno selecionado (ex.: 'MANHÃ').
+        atividades: Iterável de dicionários (uma atividade por item).
+        colunas: Colunas da planilha, usadas nas tabelas em branco.
+        checkbox_img: Imagem do checkbox compartilhada entre as tabelas.
+        logo_path (str, opcional): Caminho do logo usado na capa.
+
+    Retorna:
+        generator: Flowables na ordem em que entram no PDF.
+    """
+    yield from gerar_capa(responsavel, data_input, turno, logo_path=logo_path)
+
+    tabela_idx = 1
+    count = 0
+
+    # Tabelas com atividades, seguidas de tabelas extras em branco
+    tabela_vazia = {col: "" for col in colunas}
+    extras = (tabela_vazia for _ in range(TABELAS_EXTRAS))
+
+    for variaveis in chain(atividades, extras):
+        yield build_tabela(variaveis, checkbox_img, tabela_idx)
+        yield Spacer(1, 1)
+        tabela_idx += 1
+        count += 1
+        if count == TABELAS_POR_PAGINA:
+            yield PageBreak()
+            count = 0
+
+
+# ============================================================
+# Construção do PDF
+# ============================================================
+
+def construir_pdf(output_pdf, elementos, streaming: bool = True, perfil: str = PERFIL_PADRAO, **opcoes_doc):
+    """
+    Gera o PDF com margens e página padrão da Folha-Tarefa.
+
+    Parâmetros:
+        output_pdf (str): Caminho do arquivo de saída.
+        elementos: Iterável de flowables (geralmente de `gerar_elementos`).
+        streaming (bool): Se True, consome os elementos sob demanda;
+                          se False, monta a lista completa antes do build.
+        perfil (str): Perfil de saída (ver perfil_saida.PERFIS).
+        **opcoes_doc: Opções extras repassadas ao SimpleDocTemplate.
+    """
+    with aplicar_perfil(perfil) as opcoes_perfil:
+        doc = SimpleDocTemplate(
+            output_pdf,
+            pagesize=landscape(A4),
+            rightMargin=1 * cm,
+            leftMargin=1 * cm,
+            topMargin=1 * cm,
+            bottomMargin=1 * cm,
+            **{**opcoes_perfil, **opcoes_doc},
+        )
+
+        if streaming:
+            doc.build(FlowablesSobDemanda(elementos))
+        else:
+            doc.build(list(elementos))
+
+
+# ============================================================
+# Medição de memória
+# ============================================================
+
+def medir_pico_memoria(qtd_atividades: int, streaming: bool) -> int:
+    """Gera um PDF sintético em memória e retorna o pico de alocação (bytes)."""
+    import io
+    import os
+    import tracemalloc
+    from reportlab.platypus import Image
+
+    img_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "imagens")
+    checkbox_img = Image(os.path.join(img_dir, "square.png"), width=0.35 * cm, height=0.35 * cm)
+
+    colunas = ["Name", "Local", "Descrição", "Passagem de Serviço"]
+    atividades = (
+        {"Name": f"ATV-{i}", "Local": "U272", "Descrição": f"Atividade {i}", "Passagem de Serviço": ""}
+        for i in range(qtd_atividades)
+    )
+
+    tracemalloc.start()
+    try:
+        elementos = gerar_elementos("TESTE", "01/01/2025", "MANHÃ", atividades, colunas, checkbox_img)
+        construir_pdf(io.BytesIO(), elementos, streaming=streaming)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Pico de memória na montagem da Folha-Tarefa")
+    parser.add_argument("quantidades", nargs="*", type=int, default=[50, 200, 800])
+    args = parser.parse_args(argv)
+
+    print(f"{'atividades':>10} {'lista (MB)':>11} {'streaming (MB)':>15}")
+    for qtd in args.quantidades:
+        lista = medir_pico_memoria(qtd, streaming=False) / 2**20
+        streaming = medir_pico_memoria(qtd, streaming=True) / 2**20
+        print(f"{qtd:>10} {lista:11.1f} {streaming:15.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
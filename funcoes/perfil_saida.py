@@ -0,0 +1,184 @@
+# ============================================================
+# perfil_saida.py
+# ------------------------------------------------------------
+# Perfis de saída dos PDFs da Folha-Tarefa.
+# O perfil "impressao" reduz o tamanho dos arquivos que vão
+# para o servidor de impressão:
+#   - compressão das páginas;
+#   - imagens reduzidas para a resolução de impressão e sem
+#     canal alfa (logo/checkbox sobre fundo branco);
+#   - streams binários (sem codificação ASCII85);
+#   - imagens gravadas em cache e referenciadas pelo mesmo
+#     caminho, para que cada uma seja embutida uma única vez
+#     por documento.
+#
+# Uso (compara os bytes por PDF entre os perfis):
+#     python -m funcoes.perfil_saida [saida_tratada.xlsx] [--coluna "Encarregado Manhã"]
+# ============================================================
+import os
+import sys
+import argparse
+import tempfile
+from contextlib import contextmanager
+
+from reportlab import rl_config
+from reportlab.lib.units import cm, inch
+
+IMG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "imagens")
+
+# Pasta onde ficam as imagens já reduzidas (compartilhada entre execuções)
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "folha_tarefa_imagens")
+
+# Tamanho em que cada imagem é desenhada no PDF
+TAMANHOS_IMAGENS = {
+    "logo": ("logo.png", 3.5 * cm, 2 * cm),
+    "checkbox": ("square.png", 0.35 * cm, 0.35 * cm),
+}
+
+# Perfis disponíveis
+#   compressao: 1/0 força a compressão das páginas; None usa o padrão do ReportLab
+#   dpi: resolução máxima das imagens; None mantém o arquivo original
+#   ascii85: codifica os streams em ASCII85 (texto, ~25% maior)
+PERFIS = {
+    "padrao": {"compressao": None, "dpi": None, "ascii85": True},
+    "impressao": {"compressao": 1, "dpi": 200, "ascii85": False},
+}
+
+PERFIL_PADRAO = "impressao"
+
+
+# ============================================================
+# Imagens
+# ============================================================
+
+def preparar_imagem(caminho: str, largura: float, altura: float, dpi) -> str:
+    """
+    Retorna o caminho da imagem pronta para o perfil.
+
+    Com `dpi` definido, a imagem é reduzida para o tamanho de impressão
+    (nunca ampliada), o canal alfa é aplicado sobre fundo branco e o
+    resultado é salvo em cache. Sem `dpi`, retorna o caminho original.
+    """
+    if not dpi:
+        return caminho
+
+    from PIL import Image as PILImage
+
+    alvo = (max(1, round(largura / inch * dpi)), max(1, round(altura / inch * dpi)))
+    base = os.path.splitext(os.path.basename(caminho))[0]
+    versao = os.stat(caminho).st_mtime_ns
+    destino = os.path.join(CACHE_DIR, f"{base}_{alvo[0]}x{alvo[1]}_{versao}.png")
+    if os.path.exists(destino):
+        return destino
+
+    with PILImage.open(caminho) as img:
+        img = img.convert("RGBA")
+        fundo = PILImage.new("RGBA", img.size, (255, 255, 255, 255))
+        img = PILImage.alpha_composite(fundo, img).convert("RGB")
+
+        if img.width > alvo[0] or img.height > alvo[1]:
+            img = img.resize(alvo, PILImage.LANCZOS)
+
+        # Imagens sem cor (ex.: checkbox) ficam em tons de cinza
+        r, g, b = img.split()
+        if r.tobytes() == g.tobytes() == b.tobytes():
+            img = r
+
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temporario = f"{destino}.{os.getpid()}.tmp"
+        img.save(temporario, format="PNG", optimize=True)
+        os.replace(temporario, destino)
+
+    return destino
+
+
+def imagens_do_perfil(perfil: str = PERFIL_PADRAO, img_dir: str = IMG_DIR) -> dict:
+    """Retorna {'logo': caminho, 'checkbox': caminho} conforme o perfil."""
+    dpi = PERFIS[perfil]["dpi"]
+    return {
+        chave: preparar_imagem(os.path.join(img_dir, arquivo), largura, altura, dpi)
+        for chave, (arquivo, largura, altura) in TAMANHOS_IMAGENS.items()
+    }
+
+
+# ============================================================
+# Opções do documento
+# ============================================================
+
+@contextmanager
+def aplicar_perfil(perfil: str = PERFIL_PADRAO):
+    """
+    Aplica o perfil durante a geração de um PDF.
+
+    Retorna (via `with ... as opcoes`) as opções para o SimpleDocTemplate.
+    A codificação ASCII85 é uma configuração global do ReportLab, então é
+    restaurada ao sair do bloco.
+    """
+    config = PERFIS[perfil]
+    opcoes = {}
+    if config["compressao"] is not None:
+        opcoes["pageCompression"] = config["compressao"]
+
+    use_a85 = rl_config.useA85
+    rl_config.useA85 = 1 if config["ascii85"] else 0
+    try:
+        yield opcoes
+    finally:
+        rl_config.useA85 = use_a85
+
+
+# ============================================================
+# Comparação entre perfis
+# ============================================================
+
+def medir_bytes(atividades_por_responsavel: dict, colunas, perfil: str) -> dict:
+    """Gera os PDFs em memória com o perfil informado e retorna {responsável: bytes}."""
+    import io
+    from reportlab.platypus import Image
+    from funcoes.montar_documento import gerar_elementos, construir_pdf
+
+    imagens = imagens_do_perfil(perfil)
+    tamanhos = {}
+    for responsavel, atividades in atividades_por_responsavel.items():
+        _, largura, altura = TAMANHOS_IMAGENS["checkbox"]
+        checkbox_img = Image(imagens["checkbox"], width=largura, height=altura)
+        buffer = io.BytesIO()
+        elementos = gerar_elementos(
+            responsavel, "01/01/2025", "MANHÃ", iter(atividades), colunas, checkbox_img,
+            logo_path=imagens["logo"],
+        )
+        construir_pdf(buffer, elementos, perfil=perfil)
+        tamanhos[responsavel] = len(buffer.getvalue())
+    return tamanhos
+
+
+def main(argv=None) -> int:
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Bytes por PDF em cada perfil de saída")
+    parser.add_argument("exportacao", nargs="?", default="saida_tratada.xlsx",
+                        help="Exportação tratada por processar_excel")
+    parser.add_argument("--coluna", default="Encarregado Manhã", help="Coluna de responsável")
+    args = parser.parse_args(argv)
+
+    df = pd.read_excel(args.exportacao, dtype=str).fillna("")
+    grupos = {
+        responsavel: grupo.to_dict("records")
+        for responsavel, grupo in df.groupby(args.coluna, sort=True)
+        if responsavel.strip()
+    }
+
+    antes = medir_bytes(grupos, df.columns, "padrao")
+    depois = medir_bytes(grupos, df.columns, PERFIL_PADRAO)
+
+    print(f"\n{'responsável':<25} {'padrao (KB)':>12} {PERFIL_PADRAO + ' (KB)':>15} {'redução':>8}")
+    for responsavel in grupos:
+        a, d = antes[responsavel], depois[responsavel]
+        print(f"{responsavel:<25} {a / 1024:12.1f} {d / 1024:15.1f} {1 - d / a:8.0%}")
+    total_a, total_d = sum(antes.values()), sum(depois.values())
+    print(f"{'TOTAL':<25} {total_a / 1024:12.1f} {total_d / 1024:15.1f} {1 - total_d / total_a:8.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
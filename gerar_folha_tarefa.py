@@ -1,12 +1,14 @@
 import os
 import sys
-import pandas as pd
-from datetime import datetime, time, timedelta
-from tkinter import Tk, filedialog, Toplevel, Label, Button, StringVar, OptionMenu
-from tkcalendar import DateEntry
-from reportlab.platypus import SimpleDocTemplate, Spacer, Image, PageBreak
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.units import cm
+import threading
+from time import monotonic
+from datetime import datetime
+
+# Importante: nada pesado (pandas, reportlab, tkcalendar) é importado aqui.
+# Esses módulos são carregados apenas na etapa que precisa deles, para que a
+# janela de seleção de arquivo apareça o quanto antes.
+# Use `python -m funcoes.medir_importacao` para conferir o orçamento de
+# tempo de importação deste módulo.
 
 if getattr(sys, 'frozen', False):
     BASE_DIR = os.path.dirname(sys.executable)
@@ -15,15 +17,59 @@ else:
 
 IMG_DIR = os.path.join(BASE_DIR, "imagens")
 SAIDAS_DIR = os.path.join(BASE_DIR, "folhatarefa")
+HISTORICO_PATH = os.path.join(BASE_DIR, "historico.sqlite")
 FUNCOES_DIR = os.path.join(BASE_DIR, "funcoes")
 
 if FUNCOES_DIR not in sys.path:
     sys.path.append(FUNCOES_DIR)
 
-# Importações de módulos internos
-from funcoes.layout import build_tabela
-from funcoes.gerar_capa import gerar_capa
-from funcoes.processar_planilha_monday import processar_excel
+# Módulos pré-carregados em segundo plano enquanto o usuário escolhe o arquivo
+MODULOS_PESADOS = (
+    "pandas",
+    "reportlab.platypus",
+    "funcoes.processar_planilha_monday",
+    "funcoes.layout",
+    "funcoes.gerar_capa",
+    "funcoes.montar_documento",
+    "funcoes.perfil_saida",
+    "funcoes.calendario_turnos",
+    "funcoes.gerar_folhas",
+    "funcoes.historico",
+)
+
+
+# ============================================================
+# ⚡ Inicialização rápida
+# ============================================================
+def configurar_saida_utf8():
+    """Habilita caracteres UTF-8 no terminal (ignora se não houver console)."""
+    try:
+        if sys.stdout:
+            sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        # Sem console (modo Tkinter/--noconsole), apenas ignora
+        pass
+
+
+def pre_carregar_modulos():
+    """Importa os módulos pesados em uma thread de segundo plano.
+
+    A interface continua respondendo enquanto pandas/ReportLab carregam;
+    quando a etapa que precisa deles chegar, o import já estará pronto
+    (ou aguardará apenas o restante).
+    """
+    def _importar():
+        import importlib
+        for nome in MODULOS_PESADOS:
+            try:
+                importlib.import_module(nome)
+            except Exception:
+                # O erro real aparece no import feito pela etapa que usa o módulo
+                pass
+
+    thread = threading.Thread(target=_importar, name="pre-carregamento", daemon=True)
+    thread.start()
+    return thread
 
 
 # ============================================================
@@ -31,6 +77,10 @@ from funcoes.processar_planilha_monday import processar_excel
 # ============================================================
 def selecionar_data_turno():
     """Abre janela para o usuário escolher a data e o turno da folha-tarefa."""
+    from tkinter import Tk, Toplevel, Label, Button, StringVar, OptionMenu
+    from tkcalendar import DateEntry
+    from turnos import TURNOS
+
     root = Tk()
     root.withdraw()
 
@@ -50,8 +100,9 @@ def selecionar_data_turno():
 
     Label(janela, text="Selecione o turno:").pack(pady=5)
     turno_var = StringVar(janela)
-    turno_var.set("Manhã")  # valor padrão
-    OptionMenu(janela, turno_var, "Manhã", "Noite").pack(pady=5)
+    nomes_turnos = list(TURNOS)
+    turno_var.set(nomes_turnos[0])  # valor padrão
+    OptionMenu(janela, turno_var, *nomes_turnos).pack(pady=5)
 
     Button(janela, text="Confirmar", command=confirmar).pack(pady=10)
 
@@ -62,200 +113,144 @@ def selecionar_data_turno():
 
 
 # ============================================================
-# 📂 Seleção do arquivo Excel e pré-processamento
-# ============================================================
-Tk().withdraw()
-excel_path = filedialog.askopenfilename(
-    title="Selecione o arquivo Excel",
-    filetypes=[("Excel files", "*.xlsx *.xls")]
-)
-
-if not excel_path:
-    print("⚠️ Nenhum arquivo selecionado. Encerrando execução.")
-    exit()
-
-# Processa a planilha para garantir formatos padronizados
-entrada = excel_path
-saida = processar_excel(entrada)
-
-# Carrega o arquivo processado
-df = pd.read_excel(saida, dtype=str)
-
-
-# ============================================================
-# 🕓 Conversão de horas
-# ============================================================
-def converter_hora(valor):
-    """Converte texto de hora no formato HH:MM para objeto time."""
-    if pd.isna(valor) or str(valor).strip() == "":
-        return None
-    try:
-        horas, minutos = map(int, str(valor).split(":"))
-        return time(horas, minutos)
-    except Exception:
-        return None
-
-
-for col in ["Hora Início", "Hora Fim"]:
-    df[col] = df[col].apply(converter_hora)
-
-
-# ============================================================
-# 🧹 Tratamento de valores nulos
-# ============================================================
-for col in ["Encarregado Manhã", "Encarregado Noite", "Hora Início", "Hora Fim"]:
-    if col in df.columns:
-        df[col] = df[col].fillna("")
-
-
-# ============================================================
-# 🗓️ Seleção de data e turno
-# ============================================================
-escolha = selecionar_data_turno()
-data_input = escolha["data"]
-turno_escolhido = escolha["turno"].upper()
-data_input_dt = datetime.strptime(data_input, "%d/%m/%Y").date()
-
-
-# ============================================================
-# 📆 Conversão de colunas de data
-# ============================================================
-df["Cronograma - Start"] = pd.to_datetime(
-    df["Cronograma - Start"], errors="coerce", dayfirst=True
-).dt.date
-
-df["Cronograma - End"] = pd.to_datetime(
-    df["Cronograma - End"], errors="coerce", dayfirst=True
-).dt.date
-
-
-# ============================================================
-# ⏰ Definição das janelas de turno
+# 📂 Seleção do arquivo Excel
 # ============================================================
-hora_manha_ini = time(8, 30)
-hora_manha_fim = time(18, 0)
-hora_noite_ini = time(19, 30)
-hora_noite_fim = time(5, 0)  # madrugada do dia seguinte
+def selecionar_arquivo():
+    """Abre o diálogo de seleção do Excel exportado do Monday."""
+    from tkinter import Tk, filedialog
+
+    Tk().withdraw()
+    return filedialog.askopenfilename(
+        title="Selecione o arquivo Excel",
+        filetypes=[("Excel files", "*.xlsx *.xls")]
+    )
 
 
 # ============================================================
-# 🧭 Função de filtro por turno
+# 📥 Pré-processamento da planilha
 # ============================================================
-def pertence_turno(row):
-    """Retorna True se a atividade estiver dentro da janela do turno selecionado
-       ou se o status for 'Atraso' ou 'Em andamento'."""
-    
-    status = str(row.get("Status", "")).strip().lower()
-
-    # ✅ Regra extra: inclui sempre se o status for "atraso" ou "em andamento"
-    if status in ["atraso", "em andamento"]:
-        return True
-
-    # Validação de dados obrigatórios para filtragem por horário
-    if pd.isna(row["Cronograma - Start"]) or pd.isna(row["Cronograma - End"]):
-        return False
-    if pd.isna(row["Hora Início"]) or pd.isna(row["Hora Fim"]):
-        return False
-
-    # Combina data e hora em objetos datetime
-    dt_inicio = datetime.combine(row["Cronograma - Start"], row["Hora Início"])
-    dt_fim = datetime.combine(row["Cronograma - End"], row["Hora Fim"])
+def ler_planilha(excel_path):
+    """Processa o Excel do Monday e retorna a planilha tratada (valores em texto)."""
+    import pandas as pd
+    from funcoes.processar_planilha_monday import processar_excel
 
-    # Corrige virada de dia
-    if dt_fim <= dt_inicio:
-        dt_fim += timedelta(days=1)
-
-    # Define janela conforme turno escolhido
-    if turno_escolhido == "MANHÃ":
-        janela_ini = datetime.combine(data_input_dt, hora_manha_ini)
-        janela_fim = datetime.combine(data_input_dt, hora_manha_fim)
-    else:  # NOITE
-        janela_ini = datetime.combine(data_input_dt, hora_noite_ini)
-        janela_fim = datetime.combine(data_input_dt + timedelta(days=1), hora_noite_fim)
-
-    # Retorna True se houver sobreposição entre atividade e janela
-    return (dt_inicio < janela_fim) and (dt_fim > janela_ini)
+    # Processa a planilha para garantir formatos padronizados
+    saida = processar_excel(excel_path)
 
+    # Carrega o arquivo processado
+    return pd.read_excel(saida, dtype=str)
 
 
 # ============================================================
-# 🔍 Aplicação do filtro de turno
+# 🗄️ Histórico de exportações
 # ============================================================
-df_filtrado = df[df.apply(pertence_turno, axis=1)]
+def registrar_no_historico(df_tratado, data_input, turno_escolhido, origem=None):
+    """Guarda a planilha tratada no histórico (SQLite) e anota que ela gerou
+    as folhas da data/turno; compacta snapshots antigos uma vez por dia.
 
-atividades_ignoradas = df[~df.index.isin(df_filtrado.index)]
-for _, row in atividades_ignoradas.iterrows():
-    descricao = row.get("Descrição", "Sem descrição")
-    print(f"⚠️ Atividade ignorada (fora do turno): {descricao}")
+    Falhas no histórico não interrompem a geração das folhas.
+    """
+    try:
+        from funcoes.historico import abrir_historico, registrar_snapshot, registrar_folha, compactar_diario
 
-df = df_filtrado
+        with abrir_historico(HISTORICO_PATH) as conn:
+            snapshot_id = registrar_snapshot(conn, df_tratado, origem=origem)
+            registrar_folha(conn, data_input, turno_escolhido, snapshot_id)
+            compactar_diario(conn)
+        print(f"🗄️ Exportação registrada no histórico (snapshot {snapshot_id})")
+    except Exception as e:
+        print(f"⚠️ Não foi possível registrar no histórico: {e}")
 
 
 # ============================================================
-# 🧱 Configuração de imagens e pastas de saída
+# 🧵 Geração completa (executada em segundo plano)
 # ============================================================
-checkbox_img = Image(os.path.join(IMG_DIR, "square.png"), width=0.35 * cm, height=0.35 * cm)
-
-pasta_nome = f"{data_input_dt.strftime('%d-%m-%Y')}_{turno_escolhido}"
-output_dir = os.path.join(SAIDAS_DIR, f"Folhas-Tarefa {pasta_nome}")
-os.makedirs(output_dir, exist_ok=True)
+def executar_geracao(excel_path, data_input, turno_escolhido, notificar=None, cancelar=None):
+    """Carrega a planilha, filtra o turno e gera os PDFs, emitindo eventos de progresso.
+
+    Pensada para rodar fora da thread do Tk: não usa nenhum widget, apenas
+    chama `notificar(evento)` com dicionários {"etapa": ..., ...}.
+    """
+    from funcoes.gerar_folhas import preparar_planilha, filtrar_turno, gerar_folhas
+
+    notificar = notificar or (lambda evento: None)
+    inicio = monotonic()
+    data_input_dt = datetime.strptime(data_input, "%d/%m/%Y").date()
+
+    def finalizar(gerados):
+        notificar({
+            "etapa": "fim",
+            "cancelado": cancelar is not None and cancelar.is_set(),
+            "gerados": gerados,
+            "decorrido": monotonic() - inicio,
+        })
+        return gerados
+
+    df_tratado = ler_planilha(excel_path)
+    df = preparar_planilha(df_tratado)
+    notificar({"etapa": "leitura", "linhas": len(df), "decorrido": monotonic() - inicio})
+    if cancelar is not None and cancelar.is_set():
+        return finalizar(0)
+
+    notificar({"etapa": "historico", "linhas": len(df), "decorrido": monotonic() - inicio})
+    registrar_no_historico(
+        df_tratado, data_input, turno_escolhido, origem=os.path.basename(excel_path)
+    )
+    if cancelar is not None and cancelar.is_set():
+        return finalizar(0)
+
+    total = len(df)
+    df = filtrar_turno(df, data_input_dt, turno_escolhido)
+    notificar({
+        "etapa": "filtro",
+        "filtradas": len(df),
+        "total": total,
+        "decorrido": monotonic() - inicio,
+    })
+    if cancelar is not None and cancelar.is_set():
+        return finalizar(0)
+
+    # O ETA vem da etapa de PDFs; o tempo decorrido exibido é o da geração toda
+    def notificar_pdf(evento):
+        notificar({**evento, "decorrido": monotonic() - inicio})
+
+    gerados = gerar_folhas(
+        df, data_input, data_input_dt, turno_escolhido, notificar_pdf, cancelar,
+        saidas_dir=SAIDAS_DIR, img_dir=IMG_DIR,
+    )
+    return finalizar(gerados)
 
 
 # ============================================================
-# 👷 Geração das folhas por responsável
+# ▶️ Fluxo principal
 # ============================================================
-col_responsavel = (
-    "Encarregado Manhã" if turno_escolhido == "MANHÃ" else "Encarregado Noite"
-)
-responsaveis = sorted(set(df[col_responsavel].unique().tolist()))
-
-for responsavel in responsaveis:
-    if not responsavel.strip():
-        continue
-
-    df_responsavel = df[df[col_responsavel].str.lower() == responsavel.lower()]
-    output_pdf = os.path.join(
-        output_dir, f"Folha_Tarefa_{responsavel}_{pasta_nome}.pdf"
+def main():
+    configurar_saida_utf8()
+
+    # Carrega pandas/ReportLab enquanto o diálogo de arquivo está aberto
+    pre_carregar_modulos()
+
+    excel_path = selecionar_arquivo()
+    if not excel_path:
+        print("⚠️ Nenhum arquivo selecionado. Encerrando execução.")
+        sys.exit()
+
+    escolha = selecionar_data_turno()
+    if not escolha["data"]:
+        print("⚠️ Nenhuma data selecionada. Encerrando execução.")
+        sys.exit()
+    data_input = escolha["data"]
+    turno_escolhido = escolha["turno"].upper()
+
+    # A geração roda em segundo plano; a janela de progresso mantém o Tk responsivo
+    from funcoes.janela_progresso import executar_com_progresso
+
+    executar_com_progresso(
+        lambda notificar, cancelar: executar_geracao(
+            excel_path, data_input, turno_escolhido, notificar, cancelar
+        )
     )
 
-    doc = SimpleDocTemplate(
-        output_pdf,
-        pagesize=landscape(A4),
-        rightMargin=1 * cm,
-        leftMargin=1 * cm,
-        topMargin=1 * cm,
-        bottomMargin=1 * cm,
-    )
 
-    elementos = []
-    elementos += gerar_capa(responsavel, data_input, turno_escolhido)
-
-    tables_per_page = 4
-    tabela_idx = 1
-    count = 0
-
-    # Tabelas com atividades
-    for _, row in df_responsavel.iterrows():
-        tabela = build_tabela(row.to_dict(), checkbox_img, tabela_idx)
-        elementos.append(tabela)
-        elementos.append(Spacer(1, 1))
-        tabela_idx += 1
-        count += 1
-        if count == tables_per_page:
-            elementos.append(PageBreak())
-            count = 0
-
-    # 3 tabelas extras em branco
-    for _ in range(3):
-        tabela_vazia = {col: "" for col in df.columns}
-        tabela = build_tabela(tabela_vazia, checkbox_img, tabela_idx)
-        elementos.append(tabela)
-        elementos.append(Spacer(1, 1))
-        tabela_idx += 1
-        count += 1
-        if count == tables_per_page:
-            elementos.append(PageBreak())
-            count = 0
-
-    doc.build(elementos)
-    print(f"✅ Folha-tarefa gerada para {responsavel}: {output_pdf}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+# Arquivo separado só para manter o calendário de turnos
+# Cada turno define a janela de horário (INICIO/FIM no formato HH:MM) e a coluna do Encarregado responsável
+# Se FIM for menor ou igual a INICIO, o turno termina na madrugada do dia seguinte
+# DIAS é opcional: limita o turno a alguns dias da semana ("seg", "ter", "qua", "qui", "sex", "sáb", "dom")
+#Siga o Modelo para incluir turnos (ex.: 3 turnos na parada ou equipes só de fim de semana)
+TURNOS = {
+    "Manhã": {"INICIO": "08:30", "FIM": "18:00", "ENCARREGADO": "Encarregado Manhã"},
+    "Noite": {"INICIO": "19:30", "FIM": "05:00", "ENCARREGADO": "Encarregado Noite"},
+    # "Madrugada": {"INICIO": "00:00", "FIM": "08:00", "ENCARREGADO": "Encarregado Madrugada"},
+    # "Fim de Semana": {"INICIO": "07:00", "FIM": "17:00", "ENCARREGADO": "Encarregado FDS", "DIAS": ["sáb", "dom"]},
+}